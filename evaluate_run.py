@@ -5,14 +5,38 @@ This script allows you to evaluate a specific benchmark run by providing
 its timestamp (e.g., 20250611_024703).
 """
 import argparse
+import json
+import os
+import re
 import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List
 
 from src.core.config import Config
-from src.core.logger import setup_logger
+from src.core.logger import Logger, setup_logger
 from src.evaluation.judge import Judge
 from src.models.model_manager import ModelManager
+from src.utils.serialization import write_model_json
+
+# Generated iteration files: v<N>.html, v<N>_screenshot.png, v<N>_metadata.json
+_ITERATION_FILE = re.compile(r"^v(\d+)(\.html|_screenshot\.png|_metadata\.json)$")
+_ITERATION_FILE_KINDS = {
+    ".html": "html_path",
+    "_screenshot.png": "screenshot_path",
+    "_metadata.json": "metadata_path",
+}
+
+
+def _positive_int(value: str) -> int:
+    """Argparse type for worker counts, which must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -28,6 +52,8 @@ Examples:
   python evaluate_run.py 20250611_024703 --judges gemma3n:e2b gemma3:4b qwen2.5vl:7b
   # Evaluate specific models/tasks from a run
   python evaluate_run.py 20250611_024703 --models gemma3n:e2b gemma3:4b --tasks basic_calculator
+  # Evaluate up to 4 (model, task) pairs at once, with at most 2 judge calls in flight
+  python evaluate_run.py 20250611_024703 --jobs 4 --jobs-judge 2
         """,
     )
     parser.add_argument(
@@ -50,6 +76,12 @@ Examples:
         nargs="+",
         help="Specific tasks to evaluate from the run (default: all tasks in run)",
     )
+    parser.add_argument(
+        "--config",
+        type=str,
+        default=None,
+        help="Path to configuration file (default: built-in defaults)",
+    )
     parser.add_argument(
         "--output-dir",
         type=str,
@@ -62,73 +94,159 @@ Examples:
         default="INFO",
         help="Logging level (default: INFO)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Number of (model, task) pairs judged concurrently (default: the config's max_concurrent_models)",
+    )
+    parser.add_argument(
+        "--jobs-io",
+        type=_positive_int,
+        default=None,
+        help="Number of (model, task) pairs whose files are loaded concurrently (default: min(4, pairs))",
+    )
+    parser.add_argument(
+        "--jobs-judge",
+        type=_positive_int,
+        default=None,
+        help="Maximum number of concurrent judge inferences (default: the config's max_concurrent_models)",
+    )
     return parser.parse_args()
 
 
 def discover_run_contents(run_path: Path) -> dict:
-    """Discover models and tasks in a benchmark run."""
+    """Discover models, tasks and generated iterations in a benchmark run.
+
+    Walks the run directory once with ``os.scandir`` so directory checks use the
+    cached entry type, and records which screenshot/metadata files exist for
+    each iteration so loading needs no further ``stat`` calls.
+    """
+    if not run_path.exists():
+        raise FileNotFoundError(f"Run directory not found: {run_path}")
     run_contents = {
         "models": [],
         "tasks": {},  # model -> [tasks]
-        "generations": {},  # model -> task -> [iterations]
+        "generations": {},  # model -> task -> [iteration records]
     }
-    if not run_path.exists():
-        raise FileNotFoundError(f"Run directory not found: {run_path}")
     # Discover models
-    for model_dir in run_path.iterdir():
-        if model_dir.is_dir() and model_dir.name not in [".", ".."]:
-            model_name = model_dir.name
+    with os.scandir(run_path) as model_entries:
+        for model_entry in model_entries:
+            if not model_entry.is_dir():
+                continue
+            model_name = model_entry.name
             run_contents["models"].append(model_name)
             run_contents["tasks"][model_name] = []
             run_contents["generations"][model_name] = {}
             # Discover tasks for this model
-            for task_dir in model_dir.iterdir():
-                if task_dir.is_dir():
-                    task_name = task_dir.name
+            with os.scandir(model_entry.path) as task_entries:
+                for task_entry in task_entries:
+                    if not task_entry.is_dir():
+                        continue
+                    task_name = task_entry.name
                     run_contents["tasks"][model_name].append(task_name)
-                    # Discover iterations for this task
-                    iterations = []
-                    for file in task_dir.iterdir():
-                        if file.name.startswith("v") and file.name.endswith(".html"):
-                            # Extract iteration number (v1.html -> 1)
-                            iteration = int(file.name[1:].split(".")[0])
-                            iterations.append(iteration)
-                    run_contents["generations"][model_name][task_name] = sorted(
-                        iterations
+                    run_contents["generations"][model_name][task_name] = (
+                        _discover_iterations(task_entry.path)
                     )
     return run_contents
 
 
-def load_generation_results(
-    run_path: Path, model: str, task: str, iterations: List[int]
-) -> List[dict]:
-    """Load generation results for evaluation."""
-    results = []
-    task_path = run_path / model / task
-    for iteration in iterations:
-        html_file = task_path / f"v{iteration}.html"
-        screenshot_file = task_path / f"v{iteration}_screenshot.png"
-        metadata_file = task_path / f"v{iteration}_metadata.json"
-        if html_file.exists():
-            with open(html_file, "r", encoding="utf-8") as f:
-                html_content = f.read()
-            result = {
-                "iteration": iteration,
-                "html_content": html_content,
-                "html_path": str(html_file),
-                "screenshot_path": (
-                    str(screenshot_file) if screenshot_file.exists() else None
-                ),
-            }
-            # Load metadata if available
-            if metadata_file.exists():
-                import json
-
-                with open(metadata_file, "r") as f:
-                    metadata = json.load(f)
-                result["metadata"] = metadata
-            results.append(result)
-    return results
+def _discover_iterations(task_dir: str) -> List[dict]:
+    """Build one record per ``vN.html`` in a task directory, sorted by N.
+
+    Entries are bucketed by iteration in a single pass, so each record already
+    knows whether its screenshot and metadata files exist.
+    """
+    by_iter: Dict[int, Dict[str, str]] = {}
+    with os.scandir(task_dir) as entries:
+        for entry in entries:
+            match = _ITERATION_FILE.match(entry.name)
+            if match:
+                kind = _ITERATION_FILE_KINDS[match.group(2)]
+                by_iter.setdefault(int(match.group(1)), {})[kind] = entry.path
+    return [
+        {
+            "iteration": iteration,
+            "html_path": files["html_path"],
+            "screenshot_path": files.get("screenshot_path"),
+            "metadata_path": files.get("metadata_path"),
+        }
+        for iteration, files in sorted(by_iter.items())
+        if "html_path" in files
+    ]
+
+
+def _read_file_bytes(path: str) -> bytes:
+    """Read a whole file, sizing the read from ``fstat`` on the open descriptor."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        if len(data) < size:
+            # Short read (rare for regular files); keep reading until EOF
+            chunks = [data]
+            while chunk := os.read(fd, size):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
+def _read_iteration(record: dict) -> dict:
+    """Read the HTML and optional metadata for one iteration record."""
+    result = {
+        "iteration": record["iteration"],
+        "html_content": _read_file_bytes(record["html_path"]).decode("utf-8"),
+        "html_path": record["html_path"],
+        "screenshot_path": record["screenshot_path"],
+    }
+    # Load metadata if available
+    if record["metadata_path"]:
+        result["metadata"] = json.loads(Path(record["metadata_path"]).read_bytes())
+    return result
+
+
+def load_generation_results(iterations: List[dict]) -> List[dict]:
+    """Load generation results for evaluation from discovered iteration records.
+
+    Files are read on a small thread pool so reads overlap on slow storage.
+    """
+    if not iterations:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(iterations))) as pool:
+        return list(pool.map(_read_iteration, iterations))
+
+
+def _eval_pair(
+    judge: Judge,
+    judge_models: List[str],
+    run_path: Path,
+    model: str,
+    task: str,
+    generation_results: List[dict],
+    logger: Logger,
+) -> int:
+    """Judge a single (model, task) pair and return the number of evaluations."""
+    logger.info(
+        "Evaluating %s/%s: %d iterations", model, task, len(generation_results)
+    )
+    # Use the Judge's evaluate_all_iterations method with timestamp folder saving
+    evaluations = judge.evaluate_all_iterations(
+        judge_models=judge_models,
+        target_model=model,
+        task_name=task,
+        generation_results=generation_results,
+        save_to_timestamp_folder=str(run_path),
+    )
+    # Create task summary and save it in the timestamp folder
+    if evaluations:
+        task_path = run_path / model / task
+        summary = judge.create_task_summary(model, task, evaluations)
+        summary_path = task_path / "evaluation_summary.json"
+        write_model_json(summary, summary_path)
+        logger.info("Saved: %s", summary_path)
+    return len(evaluations)
 
 
 def main():
@@ -139,86 +257,141 @@ def main():
         args = parse_arguments()
         # Initialize logger
         logger = setup_logger(__name__, level=args.log_level)
-        logger.info(f"Evaluating benchmark run: {args.run_timestamp}")
+        logger.info("Evaluating benchmark run: %s", args.run_timestamp)
         # Construct run path
         run_path = Path(args.output_dir) / args.run_timestamp
         # Discover run contents
         run_contents = discover_run_contents(run_path)
         if not run_contents["models"]:
             raise RuntimeError(f"No models found in run: {args.run_timestamp}")
-        logger.info(f"Found models: {run_contents['models']}")
+        logger.info("Found models: %s", run_contents["models"])
         # Filter models if specified
+        available_models = set(run_contents["models"])
         models_to_evaluate = args.models if args.models else run_contents["models"]
-        models_to_evaluate = [
-            m for m in models_to_evaluate if m in run_contents["models"]
-        ]
+        models_to_evaluate = [m for m in models_to_evaluate if m in available_models]
         if not models_to_evaluate:
             raise RuntimeError(f"No valid models found to evaluate")
         # Set up judges
         judge_models = args.judges if args.judges else run_contents["models"]
-        # Create basic config for evaluation
-        config = Config()
-        config.output_dir = args.output_dir
-        config.log_level = args.log_level
-        # Initialize components
-        model_manager = ModelManager(config=config)
-        judge = Judge(model_manager, config.evaluation, config.output_dir)
-        logger.info(f"Using judges: {judge_models}")
-        # Evaluate each model and task
+        # Collect (model, task, iterations) work items
+        work = []
+        wanted_tasks = set(args.tasks) if args.tasks else None
+        tasks_by_model = run_contents["tasks"]
+        generations = run_contents["generations"]
         for model in models_to_evaluate:
-            model_tasks = run_contents["tasks"].get(model, [])
+            model_tasks = tasks_by_model.get(model, [])
+            model_generations = generations.get(model, {})
             # Filter tasks if specified
-            if args.tasks:
-                model_tasks = [t for t in model_tasks if t in args.tasks]
+            if wanted_tasks:
+                model_tasks = [t for t in model_tasks if t in wanted_tasks]
             if not model_tasks:
-                logger.warning(f"No tasks found for model {model}")
+                logger.warning("No tasks found for model %s", model)
                 continue
-            logger.info(f"Evaluating model: {model}")
             for task in model_tasks:
-                logger.info(f"  Evaluating task: {task}")
                 # Get iterations for this task
-                iterations = run_contents["generations"][model][task]
+                iterations = model_generations.get(task, [])
                 if not iterations:
-                    logger.warning(f"    No iterations found for {task}")
-                    continue
-                # Load generation results
-                generation_results = load_generation_results(
-                    run_path, model, task, iterations
-                )
-                if not generation_results:
-                    logger.warning(f"    No generation results found for {task}")
-                    continue
-                logger.info(f"    Found {len(generation_results)} iterations")
-                # Run evaluation
-                try:
-                    # Use the Judge's evaluate_all_iterations method with timestamp folder saving
-                    evaluations = judge.evaluate_all_iterations(
-                        judge_models=judge_models,
-                        target_model=model,
-                        task_name=task,
-                        generation_results=generation_results,
-                        save_to_timestamp_folder=str(run_path),
-                    )
-                    # Create task summary and save it in the timestamp folder
-                    if evaluations:
-                        task_path = run_path / model / task
-                        summary = judge.create_task_summary(model, task, evaluations)
-                        summary_path = task_path / "evaluation_summary.json"
-                        import json
-
-                        with open(summary_path, "w") as f:
-                            json.dump(summary.model_dump(), f, indent=2, default=str)
-                        logger.info(f"      Saved: evaluation_summary.json")
-                    logger.info(
-                        f"    Completed evaluation: {len(evaluations)} evaluations"
-                    )
-                except Exception as e:
-                    logger.error(f"    Failed to evaluate {task}: {e}")
+                    logger.warning("No iterations found for %s/%s", model, task)
                     continue
+                work.append((model, task, iterations))
+        if not work:
+            logger.warning("Nothing to evaluate")
+            return
+        # Create config and model manager for evaluation
+        config = Config.from_yaml(args.config) if args.config else Config()
+        config.output_dir = args.output_dir
+        config.log_level = args.log_level
+        model_manager = ModelManager(config=config)
+        judge = Judge(
+            model_manager,
+            config.evaluation,
+            config.output_dir,
+            max_concurrent=args.jobs_judge,
+        )
+        logger.info("Using judges: %s", judge_models)
+        # Two-stage pipeline: load generation files on an I/O pool and hand each
+        # loaded pair to the judge pool, so disk reads overlap with inference
+        # Pairs share the model manager, so by default run no more of them at
+        # once than it keeps models loaded; otherwise they evict each other
+        max_workers = min(args.jobs or config.max_concurrent_models, len(work))
+        io_workers = args.jobs_io or min(4, len(work))
+        logger.info(
+            "Evaluating %d (model, task) pairs with %d judge / %d I/O workers",
+            len(work),
+            max_workers,
+            io_workers,
+        )
+        # Loads only run a bounded window ahead of judging, so at most this
+        # many pairs' generation results are held in memory at once
+        window = io_workers + max_workers
+        pending = iter(work)
+        in_flight = {}
+        done = 0
+        with ThreadPoolExecutor(max_workers=io_workers) as io_pool, ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as judge_pool:
+            while True:
+                while len(in_flight) < window:
+                    item = next(pending, None)
+                    if item is None:
+                        break
+                    model, task, iterations = item
+                    load_future = io_pool.submit(load_generation_results, iterations)
+                    in_flight[load_future] = ("load", model, task)
+                if not in_flight:
+                    break
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage, model, task = in_flight.pop(future)
+                    if stage == "load":
+                        try:
+                            generation_results = future.result()
+                        except Exception as e:
+                            done += 1
+                            logger.error("Failed to load %s/%s: %s", model, task, e)
+                            continue
+                        if not generation_results:
+                            done += 1
+                            logger.warning(
+                                "No generation results found for %s/%s", model, task
+                            )
+                            continue
+                        judge_future = judge_pool.submit(
+                            _eval_pair,
+                            judge,
+                            judge_models,
+                            run_path,
+                            model,
+                            task,
+                            generation_results,
+                            logger,
+                        )
+                        in_flight[judge_future] = ("judge", model, task)
+                        continue
+                    done += 1
+                    try:
+                        count = future.result()
+                        logger.info(
+                            "[%d/%d] Completed %s/%s: %d evaluations",
+                            done,
+                            len(work),
+                            model,
+                            task,
+                            count,
+                        )
+                    except Exception as e:
+                        logger.error(
+                            "[%d/%d] Failed to evaluate %s/%s: %s",
+                            done,
+                            len(work),
+                            model,
+                            task,
+                            e,
+                        )
         # Cleanup
         model_manager.cleanup()
         logger.info("Evaluation completed successfully")
-        logger.info(f"Results saved to: {args.output_dir}/evaluations/")
+        logger.info("Results saved to: %s/evaluations/", args.output_dir)
     except KeyboardInterrupt:
         if logger:
             logger.warning("Evaluation interrupted by user")
@@ -227,13 +400,13 @@ def main():
         sys.exit(1)
     except (RuntimeError, FileNotFoundError) as e:
         if logger:
-            logger.error(f"Evaluation error: {e}")
+            logger.error("Evaluation error: %s", e)
         else:
             print(f"Evaluation error: {e}")
         sys.exit(1)
     except Exception as e:
         if logger:
-            logger.error(f"Unexpected error: {e}", exc_info=True)
+            logger.error("Unexpected error: %s", e, exc_info=True)
         else:
             print(f"Unexpected error: {e}")
         sys.exit(1)
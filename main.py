@@ -9,9 +9,10 @@ import sys
 from pathlib import Path
 from typing import List, Optional
 
-from src.core.config import Config
+from src.core.config import Config, ModelConfig, TaskConfig
 from src.core.logger import setup_logger
 from src.pipeline.benchmark_pipeline import BenchmarkPipeline
+from src.tasks.task_loader import get_task
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -117,17 +118,12 @@ def create_config_from_args(args: argparse.Namespace) -> Config:
     original_judges = config.judges[:]
     # Override with command line arguments
     if args.models:
-        from src.core.config import ModelConfig
-
         config.models = [ModelConfig(name=model) for model in args.models]
     if args.tasks:
         # Filter existing tasks or create new ones
-        from src.core.config import TaskConfig
-        from src.tasks.task_definitions import get_task_by_name
-
         filtered_tasks = []
         for task_name in args.tasks:
-            task_def = get_task_by_name(task_name)
+            task_def = get_task(task_name)
             if task_def:
                 filtered_tasks.append(
                     TaskConfig(
@@ -174,16 +170,16 @@ def main():
         # Initialize logger
         logger = setup_logger(__name__, level=args.log_level)
         logger.info("Starting Multimodal LLM Benchmark System")
-        logger.info(f"Configuration: {config.to_dict()}")
+        logger.info("Configuration: %s", config.to_dict())
         # Validate configuration
         config.validate()
-        # Create and run benchmark pipeline
-        pipeline = BenchmarkPipeline(config)
+        # Dry runs only validate configuration, so skip pipeline/model setup
         if args.dry_run:
-            logger.info("Dry run mode - validating configuration and setup")
-            # pipeline.validate_setup()  # TODO: Implement validate_setup method
+            logger.info("Dry run mode - validating configuration")
             logger.info("Dry run completed successfully")
             return
+        # Create and run benchmark pipeline
+        pipeline = BenchmarkPipeline(config)
         # Execute the benchmark
         if config.mode == "generation-only":
             results = pipeline.run_generation_phase()
@@ -192,7 +188,7 @@ def main():
         else:  # full-pipeline
             results = pipeline.run_full_pipeline()
         logger.info("Benchmark completed successfully")
-        logger.info(f"Results saved to: {config.output_dir}")
+        logger.info("Results saved to: %s", config.output_dir)
         # Print summary
         print("\n" + "=" * 80)
         print("BENCHMARK SUMMARY")
@@ -211,13 +207,13 @@ def main():
         sys.exit(1)
     except RuntimeError as e:
         if logger:
-            logger.error(f"Benchmark error: {e}")
+            logger.error("Benchmark error: %s", e)
         else:
             print(f"Benchmark error: {e}")
         sys.exit(1)
     except Exception as e:
         if logger:
-            logger.error(f"Unexpected error: {e}", exc_info=True)
+            logger.error("Unexpected error: %s", e, exc_info=True)
         else:
             print(f"Unexpected error: {e}")
         sys.exit(1)
@@ -3,18 +3,34 @@
 OpenUI Eval CLI - Command Line Interface for the Multimodal LLM Benchmark System
 """
 
+import functools
+import hashlib
+import json
 import os
+import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
-from rich import print as rprint
 
-from core.config import Config
-from core.logger import setup_logger
-from pipeline.benchmark_pipeline import BenchmarkPipeline
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from core.config import Config
+
+# Heavy modules (rich, config, the pipeline and its providers) are imported
+# inside the commands that need them so that e.g. `init` starts quickly.
+
+# Generated iteration files are named v<N>.html (bound match for the scan loop)
+_match_iteration_html = re.compile(r"^v(\d+)\.html$").match
+
+# Successful provider probes are reused for this long across CLI invocations
+_PROVIDER_PROBE_CACHE = Path.home() / ".cache" / "openui-eval" / "provider_probe.json"
+_PROVIDER_PROBE_TTL_SECONDS = 60
 
 app = typer.Typer(
     name="openui-eval",
@@ -22,7 +38,18 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
+
+@functools.lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Return the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def rprint(*objects, **kwargs):
+    """Print with Rich markup through the shared console."""
+    _console().print(*objects, **kwargs)
 
 
 @app.command()
@@ -32,7 +59,8 @@ def init():
 
     Creates config.yaml and .env files in the current directory if they don't exist.
     """
-    rprint("[bold blue]Initializing OpenUI Eval...[/bold blue]")
+    # Plain print rather than rprint so this command never imports Rich
+    print("Initializing OpenUI Eval...")
 
     # Check and create config.yaml
     config_path = Path("config.yaml")
@@ -64,9 +92,9 @@ logging:
   level: "INFO"
 """
         config_path.write_text(default_config)
-        rprint("Created default [green]config.yaml[/green]")
+        print("Created default config.yaml")
     else:
-        rprint("[yellow]config.yaml[/yellow] already exists")
+        print("config.yaml already exists")
 
     # Check and create .env
     env_path = Path(".env")
@@ -75,19 +103,79 @@ logging:
 GEMINI_API_KEY=your_key_here
 """
         env_path.write_text(default_env)
-        rprint("Created default [green].env[/green]")
+        print("Created default .env")
     else:
-        rprint("[yellow].env[/yellow] already exists")
+        print(".env already exists")
+
+    print("Initialization complete!")
+    print("\nNext steps:")
+    print("1. Edit .env to add your API keys")
+    print("2. Edit config.yaml to configure models and tasks")
+    print("3. Run: openui-eval start")
+
+
+def _provider_probe_key(config: "Config") -> str:
+    """Hash the provider settings that determine a probe's outcome."""
+    probe_input = {
+        "provider_type": config.provider.provider_type,
+        "ollama_host": config.provider.ollama_host,
+        "vllm_url": config.provider.vllm_url,
+        "openrouter_api_key": config.provider.openrouter_api_key,
+        "gemini_api_key": config.provider.gemini_api_key,
+    }
+    return hashlib.sha1(
+        json.dumps(probe_input, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def _load_provider_probes() -> dict:
+    """Load cached provider probes, ignoring a missing or corrupt cache file."""
+    try:
+        data = json.loads(_PROVIDER_PROBE_CACHE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    # Drop entries that are not well-formed probes rather than failing on them
+    return {
+        key: probe
+        for key, probe in data.items()
+        if isinstance(probe, dict)
+        and isinstance(probe.get("checked_at"), (int, float))
+        and isinstance(probe.get("models"), list)
+    }
+
+
+def _read_provider_probe(key: str) -> Optional[list]:
+    """Return cached available models for a probe key if still fresh."""
+    probe = _load_provider_probes().get(key)
+    if probe and time.time() - probe.get("checked_at", 0) < _PROVIDER_PROBE_TTL_SECONDS:
+        return probe.get("models")
+    return None
+
+
+def _write_provider_probe(key: str, models: list) -> None:
+    """Record a successful probe, dropping expired entries."""
+    now = time.time()
+    probes = {
+        k: v
+        for k, v in _load_provider_probes().items()
+        if now - v.get("checked_at", 0) < _PROVIDER_PROBE_TTL_SECONDS
+    }
+    probes[key] = {"checked_at": now, "models": list(models)}
+    try:
+        _PROVIDER_PROBE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _PROVIDER_PROBE_CACHE.write_text(json.dumps(probes))
+    except OSError:
+        pass
 
-    rprint("[bold green]Initialization complete![/bold green]")
-    rprint("\nNext steps:")
-    rprint("1. Edit [cyan].env[/cyan] to add your API keys")
-    rprint("2. Edit [cyan]config.yaml[/cyan] to configure models and tasks")
-    rprint("3. Run: [cyan]openui-eval start[/cyan]")
 
+def check_provider_availability(config: "Config", use_cache: bool = True) -> bool:
+    """Check if the configured provider is available.
 
-def check_provider_availability(config: Config) -> bool:
-    """Check if the configured provider is available."""
+    Successful probes are cached for a short TTL so repeated invocations skip
+    the network round-trips; failures are never cached.
+    """
     from models.provider_factory import create_provider
     from models.base_provider import LLMProvider
 
@@ -95,29 +183,36 @@ def check_provider_availability(config: Config) -> bool:
         provider_type = config.provider.provider_type
         rprint(f"Checking {provider_type} provider availability...")
 
-        provider_config = {
-            "gemini_api_key": getattr(config.provider, "gemini_api_key", None),
-            "provider_type": config.provider.provider_type,
-            "timeout": 60,  # Increase timeout to 60 seconds
-        }
-        provider: LLMProvider = create_provider(provider_type, provider_config)
-
-        if not provider.is_available():
-            rprint(f"Cannot connect to {provider_type} provider")
-            if provider_type == "ollama":
-                rprint(f"   Is Ollama running at {config.provider.ollama_host}?")
-            elif provider_type == "openrouter":
-                rprint("   Check your OPENROUTER_API_KEY in .env")
-            elif provider_type == "gemini":
-                rprint("   Check your GEMINI_API_KEY in .env")
-                if hasattr(provider, "_last_error") and provider._last_error:
-                    rprint(f"   Detailed error: {provider._last_error}")
-            return False
+        probe_key = _provider_probe_key(config)
+        available_models = _read_provider_probe(probe_key) if use_cache else None
+
+        if available_models is None:
+            provider_config = {
+                "gemini_api_key": getattr(config.provider, "gemini_api_key", None),
+                "provider_type": config.provider.provider_type,
+                "timeout": 60,  # Increase timeout to 60 seconds
+            }
+            provider: LLMProvider = create_provider(provider_type, provider_config)
+
+            if not provider.is_available():
+                rprint(f"Cannot connect to {provider_type} provider")
+                if provider_type == "ollama":
+                    rprint(f"   Is Ollama running at {config.provider.ollama_host}?")
+                elif provider_type == "openrouter":
+                    rprint("   Check your OPENROUTER_API_KEY in .env")
+                elif provider_type == "gemini":
+                    rprint("   Check your GEMINI_API_KEY in .env")
+                    if hasattr(provider, "_last_error") and provider._last_error:
+                        rprint(f"   Detailed error: {provider._last_error}")
+                return False
+
+            available_models = provider.list_models()
+            if use_cache:
+                _write_provider_probe(probe_key, available_models)
 
         rprint(f"{provider_type.title()} provider is available")
 
         # Check model availability
-        available_models = provider.list_models()
         requested_models = [model.name for model in config.models]
 
         missing_models = []
@@ -144,7 +239,12 @@ def check_provider_availability(config: Config) -> bool:
 def start(
     config: Optional[str] = typer.Option(
         "config.yaml", "--config", "-c", help="Path to configuration file"
-    )
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Always re-probe the provider instead of using the cache",
+    ),
 ):
     """
     Start the OpenUI Eval benchmark pipeline.
@@ -153,9 +253,12 @@ def start(
     """
     rprint("[bold blue]Starting OpenUI Eval...[/bold blue]")
 
+    from core.config import Config
+    from core.logger import setup_logger
+    from pipeline.benchmark_pipeline import BenchmarkPipeline
+
     # Validate config file exists
-    config_path = Path(config)
-    if not config_path.exists():
+    if not os.path.isfile(config):
         rprint(f"Configuration file [red]{config}[/red] not found")
         rprint("Run [cyan]openui-eval init[/cyan] to create default configuration")
         raise typer.Exit(1)
@@ -163,7 +266,7 @@ def start(
     try:
         # Load configuration
         rprint(f"Loading configuration from {config}...")
-        app_config = Config.from_yaml(config_path)
+        app_config = Config.from_yaml(config)
 
         # Apply environment overrides
         app_config.apply_env_overrides()
@@ -174,7 +277,7 @@ def start(
 
         # Pre-flight checks
         rprint("Performing pre-flight checks...")
-        if not check_provider_availability(app_config):
+        if not check_provider_availability(app_config, use_cache=not no_cache):
             rprint("Pre-flight checks failed")
             raise typer.Exit(1)
 
@@ -225,6 +328,20 @@ def evaluate(
     config: Optional[str] = typer.Option(
         "config.yaml", "--config", "-c", help="Path to configuration file"
     ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        min=1,
+        help="Number of model/task pairs evaluated concurrently "
+        "(default: max_concurrent_models from the config)",
+    ),
+    jobs_judge: Optional[int] = typer.Option(
+        None,
+        "--jobs-judge",
+        min=1,
+        help="Maximum number of concurrent judge inferences "
+        "(default: max_concurrent_models from the config)",
+    ),
 ):
     """
     Evaluate an existing benchmark run.
@@ -233,6 +350,9 @@ def evaluate(
     """
     rprint(f"[bold blue]Evaluating benchmark run: {run_timestamp}[/bold blue]")
 
+    from core.config import Config
+    from core.logger import setup_logger
+
     # Parse comma-separated options
     judge_models = None
     if judges:
@@ -248,15 +368,14 @@ def evaluate(
 
     try:
         # Validate config file exists
-        config_path = Path(config)
-        if not config_path.exists():
+        if not os.path.isfile(config):
             rprint(f"Configuration file [red]{config}[/red] not found")
             rprint("Run [cyan]openui-eval init[/cyan] to create default configuration")
             raise typer.Exit(1)
 
         # Load configuration
         rprint(f"Loading configuration from {config}...")
-        app_config = Config.from_yaml(config_path)
+        app_config = Config.from_yaml(config)
         app_config.apply_env_overrides()
 
         # Setup logging
@@ -296,13 +415,20 @@ def evaluate(
         from evaluation.judge import Judge
 
         model_manager = ModelManager(config=app_config)
-        judge = Judge(model_manager, app_config.evaluation, app_config.output_dir)
+        judge = Judge(
+            model_manager,
+            app_config.evaluation,
+            app_config.output_dir,
+            max_concurrent=jobs_judge,
+        )
 
         rprint(f"Using judges: {', '.join(judge_models)}")
 
-        # Evaluate each model and task
+        # Build a flat worklist of (model, task, iterations)
+        worklist = []
         for model in models_to_evaluate:
-            model_tasks = run_contents["tasks"].get(model, [])
+            model_generations = run_contents["generations"].get(model, {})
+            model_tasks = list(model_generations)
             # Filter tasks if specified
             if tasks_to_evaluate:
                 model_tasks = [t for t in model_tasks if t in tasks_to_evaluate]
@@ -311,53 +437,66 @@ def evaluate(
                 rprint(f"No tasks found for model {model}")
                 continue
 
-            rprint(f"Evaluating model: {model}")
             for task in model_tasks:
-                rprint(f"  Evaluating task: {task}")
-                # Get iterations for this task
-                iterations = run_contents["generations"][model][task]
+                iterations = model_generations[task]
                 if not iterations:
-                    rprint(f"    No iterations found for {task}")
-                    continue
-
-                # Load generation results
-                generation_results = _load_generation_results(
-                    run_path, model, task, iterations
-                )
-
-                if not generation_results:
-                    rprint(f"    No generation results found for {task}")
-                    continue
-
-                rprint(f"    Found {len(generation_results)} iterations")
-
-                # Run evaluation
-                try:
-                    evaluations = judge.evaluate_all_iterations(
-                        judge_models=judge_models,
-                        target_model=model,
-                        task_name=task,
-                        generation_results=generation_results,
-                        save_to_timestamp_folder=str(run_path),
-                    )
-
-                    # Create task summary and save it in the timestamp folder
-                    if evaluations:
-                        task_path = run_path / model / task
-                        summary = judge.create_task_summary(model, task, evaluations)
-                        summary_path = task_path / "evaluation_summary.json"
-
-                        import json
-
-                        with open(summary_path, "w") as f:
-                            json.dump(summary.model_dump(), f, indent=2, default=str)
-                        rprint(f"      Saved: evaluation_summary.json")
-
-                    rprint(f"    Completed evaluation: {len(evaluations)} evaluations")
-
-                except Exception as e:
-                    rprint(f"    Failed to evaluate {task}: {e}")
+                    rprint(f"  No iterations found for {model}/{task}")
                     continue
+                worklist.append((model, task, iterations))
+
+        # Judge (model, task) pairs concurrently; each pair is network-bound
+        if worklist:
+            from rich.progress import Progress
+
+            rprint(f"Evaluating {len(worklist)} model/task pairs...")
+            # Live progress on a terminal; otherwise just the final summary
+            progress = Progress(console=_console()) if sys.stdout.isatty() else None
+            failures = []
+            evaluation_total = 0
+            # Pairs share the model manager, so by default run no more of them
+            # at once than it keeps models loaded; otherwise they evict each other
+            max_workers = min(jobs or app_config.max_concurrent_models, len(worklist))
+            with ThreadPoolExecutor(
+                max_workers=max_workers
+            ) as pool, progress or nullcontext():
+                futures = {
+                    pool.submit(
+                        _evaluate_task,
+                        judge,
+                        judge_models,
+                        run_path,
+                        model,
+                        task,
+                        iterations,
+                    ): (model, task)
+                    for model, task, iterations in worklist
+                }
+                if progress:
+                    bar = progress.add_task("Evaluating", total=len(futures))
+                for future in as_completed(futures):
+                    model, task = futures[future]
+                    try:
+                        evaluation_count = future.result()
+                    except Exception as e:
+                        failures.append(f"{model}/{task}: {e}")
+                    else:
+                        if evaluation_count is None:
+                            failures.append(
+                                f"{model}/{task}: no generation results found"
+                            )
+                        else:
+                            evaluation_total += evaluation_count
+                    if progress:
+                        progress.update(
+                            bar, advance=1, description=f"Evaluated {model}/{task}"
+                        )
+
+            rprint(
+                f"Evaluated {len(worklist) - len(failures)}/{len(worklist)} "
+                f"model/task pairs: {evaluation_total} evaluations"
+            )
+            for failure in failures:
+                rprint(f"  [yellow]Failed[/yellow] {failure}")
 
         # Cleanup
         model_manager.cleanup()
@@ -373,82 +512,129 @@ def evaluate(
         raise typer.Exit(1)
 
 
+def _evaluate_task(
+    judge, judge_models: list, run_path: Path, model: str, task: str, iterations: list
+) -> Optional[int]:
+    """Judge every iteration of one model/task pair and save its summary.
+
+    Returns the number of evaluations, or None if no generation results could
+    be loaded.
+    """
+    from utils.serialization import write_model_json
+
+    generation_results = _load_generation_results(run_path, model, task, iterations)
+    if not generation_results:
+        return None
+
+    evaluations = judge.evaluate_all_iterations(
+        judge_models=judge_models,
+        target_model=model,
+        task_name=task,
+        generation_results=generation_results,
+        save_to_timestamp_folder=str(run_path),
+    )
+
+    # Create task summary and save it in the timestamp folder
+    if evaluations:
+        summary = judge.create_task_summary(model, task, evaluations)
+        write_model_json(summary, run_path / model / task / "evaluation_summary.json")
+
+    return len(evaluations)
+
+
 def _discover_run_contents(run_path: Path) -> dict:
-    """Discover models and tasks in a benchmark run."""
-    run_contents = {
-        "models": [],
-        "tasks": {},  # model -> [tasks]
-        "generations": {},  # model -> task -> [iterations]
-    }
+    """Discover models and tasks in a benchmark run.
+
+    Uses ``os.scandir`` so directory checks come from the cached entry type
+    rather than a ``stat`` per path.
+    """
+    models = []
+    generations = {}  # model -> task -> [iterations]; tasks are its keys
+    run_contents = {"models": models, "generations": generations}
 
     if not run_path.exists():
         raise FileNotFoundError(f"Run directory not found: {run_path}")
 
     # Discover models
-    for model_dir in run_path.iterdir():
-        if model_dir.is_dir() and model_dir.name not in [".", ".."]:
-            model_name = model_dir.name
-            run_contents["models"].append(model_name)
-            run_contents["tasks"][model_name] = []
-            run_contents["generations"][model_name] = {}
+    with os.scandir(run_path) as model_entries:
+        for model_entry in model_entries:
+            if not model_entry.is_dir():
+                continue
+            model_name = model_entry.name
+            models.append(model_name)
+            model_generations = generations[model_name] = {}
 
             # Discover tasks for this model
-            for task_dir in model_dir.iterdir():
-                if task_dir.is_dir():
-                    task_name = task_dir.name
-                    run_contents["tasks"][model_name].append(task_name)
-
-                    # Discover iterations for this task
-                    iterations = []
-                    for file in task_dir.iterdir():
-                        if file.name.startswith("v") and file.name.endswith(".html"):
-                            # Extract iteration number (v1.html -> 1)
-                            iteration = int(file.name[1:].split(".")[0])
-                            iterations.append(iteration)
-
-                    run_contents["generations"][model_name][task_name] = sorted(
-                        iterations
-                    )
+            with os.scandir(model_entry.path) as task_entries:
+                for task_entry in task_entries:
+                    if not task_entry.is_dir():
+                        continue
+
+                    # Discover iterations for this task (v1.html -> 1)
+                    with os.scandir(task_entry.path) as file_entries:
+                        iterations = [
+                            int(match.group(1))
+                            for file_entry in file_entries
+                            if (match := _match_iteration_html(file_entry.name))
+                        ]
+                    iterations.sort()
+                    model_generations[task_entry.name] = iterations
 
     return run_contents
 
 
-def _load_generation_results(
-    run_path: Path, model: str, task: str, iterations: list
-) -> list:
-    """Load generation results for evaluation."""
-    results = []
+def _read_iteration(
+    run_path: Path, model: str, task: str, iteration: int
+) -> Optional[dict]:
+    """Collect one iteration's paths and metadata; None if the HTML is missing.
+
+    The HTML itself is not read here; the judge loads it from ``html_path``
+    when it builds the prompt, so a run's pages are not all held in memory.
+    """
     task_path = run_path / model / task
+    html_file = task_path / f"v{iteration}.html"
+    screenshot_file = task_path / f"v{iteration}_screenshot.png"
+    metadata_file = task_path / f"v{iteration}_metadata.json"
+
+    if not html_file.is_file():
+        return None
+
+    result = {
+        "iteration": iteration,
+        "html_path": str(html_file),
+        "screenshot_path": (
+            str(screenshot_file) if screenshot_file.exists() else None
+        ),
+    }
 
-    for iteration in iterations:
-        html_file = task_path / f"v{iteration}.html"
-        screenshot_file = task_path / f"v{iteration}_screenshot.png"
-        metadata_file = task_path / f"v{iteration}_metadata.json"
-
-        if html_file.exists():
-            with open(html_file, "r", encoding="utf-8") as f:
-                html_content = f.read()
-
-            result = {
-                "iteration": iteration,
-                "html_content": html_content,
-                "html_path": str(html_file),
-                "screenshot_path": (
-                    str(screenshot_file) if screenshot_file.exists() else None
-                ),
-            }
+    # Load metadata if available
+    try:
+        metadata_bytes = metadata_file.read_bytes()
+    except FileNotFoundError:
+        pass
+    else:
+        result["metadata"] = json.loads(metadata_bytes)
 
-            # Load metadata if available
-            if metadata_file.exists():
-                import json
+    return result
 
-                with open(metadata_file, "r") as f:
-                    metadata = json.load(f)
-                result["metadata"] = metadata
 
-            results.append(result)
+def _load_generation_results(
+    run_path: Path, model: str, task: str, iterations: list
+) -> list:
+    """Load generation results for evaluation.
 
-    return results
+    Iterations are read on a thread pool so file I/O overlaps; results keep
+    iteration order.
+    """
+    if not iterations:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(16, len(iterations))) as pool:
+        results = pool.map(
+            lambda iteration: _read_iteration(run_path, model, task, iteration),
+            iterations,
+        )
+        return [result for result in results if result is not None]
 
 
 if __name__ == "__main__":
@@ -1,7 +1,12 @@
 """Configuration management for the benchmark system."""
 
+import functools
+import json
 import os
-from dataclasses import dataclass, field
+import pickle
+import sys
+import tomllib
+from dataclasses import asdict, dataclass, field, fields, replace
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -11,8 +16,126 @@ from dotenv import load_dotenv
 # Load environment variables immediately
 load_dotenv()
 
+# Prefer the libyaml-backed loader and dumper; fall back to pure Python ones
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+# Default values are kept as immutable module constants; the dataclass
+# factories hand out fresh copies so instances never share mutable state
+_DEFAULT_MODEL_NAMES = (
+    "gemma3n:e2b",
+    "gemma3:4b",
+    "qwen2.5vl:7b",
+    "granite3.2-vision:2b",
+    "llama3.2-vision:11b",
+    "minicpm-v:8b",
+    "llava-phi3:3.8b",
+)
+_DEFAULT_CRITERIA = (
+    "visual_appeal",
+    "functionality",
+    "responsiveness",
+    "code_quality",
+    "task_completion",
+)
+_DEFAULT_FRAMEWORKS = ("react", "nextjs", "vue", "angular", "svelte")
+_DEFAULT_PORTS = {
+    "react": 3000,
+    "nextjs": 3000,
+    "vue": 5173,
+    "angular": 4200,
+    "svelte": 5173,
+}
+
+# Pipeline modes accepted by Config.validate
+_VALID_MODES = frozenset({"generation-only", "judging-only", "full-pipeline"})
+
+# Environment overrides: (variable, field, converter) per config section
+_MODEL_ENV_OVERRIDES = (
+    ("BENCHMARK_TEMPERATURE", "temperature", float),
+    ("BENCHMARK_NUM_CTX", "num_ctx", int),
+)
+_PIPELINE_ENV_OVERRIDES = (
+    ("BENCHMARK_ITERATIONS", "iterations", int),
+    ("BENCHMARK_MODE", "mode", str),
+    ("BENCHMARK_OUTPUT_DIR", "output_dir", str),
+    ("BENCHMARK_LOG_LEVEL", "log_level", str),
+)
+_PROVIDER_ENV_OVERRIDES = (
+    ("LLM_PROVIDER", "provider_type", str),
+    ("OLLAMA_HOST", "ollama_host", str),
+    ("VLLM_URL", "vllm_url", str),
+    ("VLLM_MODEL", "vllm_model", str),
+    ("OPENROUTER_URL", "openrouter_url", str),
+    ("OPENROUTER_MODEL", "openrouter_model", str),
+    ("OPENROUTER_API_KEY", "openrouter_api_key", str),
+    ("OPENROUTER_REQUESTS_PER_MINUTE", "openrouter_requests_per_minute", int),
+)
+
+
+def _env_overrides(table: tuple) -> Dict[str, Any]:
+    """Collect converted values for the non-empty variables in an override table."""
+    env = os.environ
+    overrides = {}
+    for variable, name, convert in table:
+        value = env.get(variable)
+        if value:
+            overrides[name] = convert(value)
+    return overrides
+
+
+def _load_yaml_data(yaml_path: str) -> Any:
+    """Parse a config file with the fastest available safe loader.
+
+    ``.json`` and ``.toml`` files skip PyYAML entirely (json and tomllib);
+    anything else is parsed as YAML. The file is handed over as one
+    bytes buffer so the loader decodes it itself instead of pulling text
+    through Python's incremental decoder.
+    """
+    with open(yaml_path, "rb") as f:
+        raw = f.read()
+    suffix = os.path.splitext(yaml_path)[1].lower()
+    if suffix == ".json":
+        return json.loads(raw)
+    if suffix == ".toml":
+        return tomllib.loads(raw.decode("utf-8"))
+    return yaml.load(raw, Loader=_YAML_LOADER)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(path_abs: str, mtime_ns: int, size: int) -> bytes:
+    """Build a Config from YAML once per (path, mtime, size) within a process.
+
+    The config is kept pickled in memory so each caller can unpickle a
+    private copy, which is much cheaper than ``copy.deepcopy``. Nothing is
+    written to or read back from disk.
+    """
+    return pickle.dumps(
+        Config.from_dict(_load_yaml_data(path_abs)), protocol=pickle.HIGHEST_PROTOCOL
+    )
+
 
-@dataclass
+def _task_to_dict(task: Any) -> Dict[str, Any]:
+    """Convert a TaskConfig or task-loader TaskDefinition to a TaskConfig dict."""
+    if isinstance(task, TaskConfig):
+        return asdict(task)
+    return {
+        "name": task.name,
+        "description": task.description,
+        "prompt_template": task.prompt,
+        "expected_elements": task.expected_features,
+        "difficulty": (
+            task.difficulty.value
+            if hasattr(task.difficulty, "value")
+            else str(task.difficulty)
+        ),
+        "project_type": task.project_type,
+        "framework_version": task.framework_version,
+    }
+
+
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """Configuration for individual models."""
 
@@ -24,7 +147,11 @@ class ModelConfig:
     max_retries: int = 3
 
 
-@dataclass
+# Default models are frozen, so every default Config can share these instances
+_DEFAULT_MODELS = tuple(ModelConfig(name) for name in _DEFAULT_MODEL_NAMES)
+
+
+@dataclass(frozen=True, slots=True)
 class TaskConfig:
     """Configuration for benchmark tasks."""
 
@@ -36,8 +163,13 @@ class TaskConfig:
     project_type: str = "html"  # html, react, vue, angular, nextjs, svelte
     framework_version: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # Prompts are long and repeated across loads; share one string object
+        if isinstance(self.prompt_template, str):
+            object.__setattr__(self, "prompt_template", sys.intern(self.prompt_template))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RenderingConfig:
     """Configuration for web rendering."""
 
@@ -49,31 +181,23 @@ class RenderingConfig:
     timeout: int = 30
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProjectConfig:
     """Configuration for multi-file projects."""
 
     work_dir: str = "temp_projects"
     node_version: str = "22.12.0"  # Node v22 LTS
     supported_frameworks: List[str] = field(
-        default_factory=lambda: ["react", "nextjs", "vue", "angular", "svelte"]
-    )
-    default_ports: Dict[str, int] = field(
-        default_factory=lambda: {
-            "react": 3000,
-            "nextjs": 3000,
-            "vue": 5173,
-            "angular": 4200,
-            "svelte": 5173,
-        }
+        default_factory=lambda: list(_DEFAULT_FRAMEWORKS)
     )
+    default_ports: Dict[str, int] = field(default_factory=lambda: dict(_DEFAULT_PORTS))
     install_timeout: int = 300  # 5 minutes
     build_timeout: int = 300  # 5 minutes
     server_start_timeout: int = 60  # 1 minute
     cleanup_on_exit: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProviderConfig:
     """Configuration for LLM providers."""
 
@@ -99,35 +223,17 @@ class ProviderConfig:
     timeout: int = 300
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EvaluationConfig:
     """Configuration for evaluation/judging."""
 
-    judge_models: List[str] = field(
-        default_factory=lambda: [
-            "gemma3n:e2b",
-            "gemma3:4b",
-            "qwen2.5vl:7b",
-            "granite3.2-vision:2b",
-            "llama3.2-vision:11b",
-            "minicpm-v:8b",
-            "llava-phi3:3.8b",
-        ]
-    )
-    criteria: List[str] = field(
-        default_factory=lambda: [
-            "visual_appeal",
-            "functionality",
-            "responsiveness",
-            "code_quality",
-            "task_completion",
-        ]
-    )
+    judge_models: List[str] = field(default_factory=lambda: list(_DEFAULT_MODEL_NAMES))
+    criteria: List[str] = field(default_factory=lambda: list(_DEFAULT_CRITERIA))
     scoring_scale: int = 10
     temperature: float = 0.1
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TasksConfig:
     """Configuration for task loading and management."""
 
@@ -145,22 +251,165 @@ class TasksConfig:
     project_types: List[str] = field(default_factory=list)
 
 
-@dataclass
+# Keys accepted from the nested config sections
+_RENDERING_FIELDS = frozenset(f.name for f in fields(RenderingConfig))
+_EVALUATION_FIELDS = frozenset(f.name for f in fields(EvaluationConfig))
+_PROVIDER_FIELDS = frozenset(f.name for f in fields(ProviderConfig))
+_PROJECT_FIELDS = frozenset(f.name for f in fields(ProjectConfig))
+
+
+def _handle_models(models_data: List[Any]) -> List[ModelConfig]:
+    """Build model configs from names or full model mappings."""
+    return [
+        (
+            ModelConfig(name=model_data)
+            if isinstance(model_data, str)
+            else ModelConfig(**model_data)
+        )
+        for model_data in models_data
+    ]
+
+
+def _load_named_task(task_name: str) -> Optional[TaskConfig]:
+    """Build a TaskConfig for a task known to the task loader, if any."""
+    from tasks.task_loader import get_task
+
+    task_def = get_task(task_name)
+    if task_def is None:
+        return None
+    return TaskConfig(
+        name=task_def.name,
+        description=task_def.description,
+        prompt_template=task_def.prompt,
+        project_type=task_def.project_type,
+        framework_version=task_def.framework_version,
+    )
+
+
+def _handle_tasks(tasks_data: Any) -> Any:
+    """Resolve task names or full task mappings into task configs.
+
+    Raises ValueError naming every task name the task loader does not know.
+    """
+    if isinstance(tasks_data, dict) and "task_names" in tasks_data:
+        # Task names from configuration
+        entries = tasks_data["task_names"]
+    elif isinstance(tasks_data, list):
+        # New format with full task configurations or simple task names
+        entries = tasks_data
+    else:
+        return tasks_data
+    tasks = []
+    unknown_tasks = []
+    for task_data in entries:
+        if isinstance(task_data, dict):
+            tasks.append(TaskConfig(**task_data))
+            continue
+        task = _load_named_task(task_data)
+        if task is None:
+            unknown_tasks.append(task_data)
+        else:
+            tasks.append(task)
+    if unknown_tasks:
+        raise ValueError(f"Unknown tasks: {', '.join(map(str, unknown_tasks))}")
+    return tasks
+
+
+def _handle_rendering(rendering_data: Any) -> RenderingConfig:
+    """Build the rendering config, mapping the webdriver/screenshot layout."""
+    if not rendering_data:
+        return RenderingConfig()
+    if not isinstance(rendering_data, dict):
+        return RenderingConfig(**rendering_data)
+    # Extract only the fields that RenderingConfig expects
+    rendering_config = {}
+    if "webdriver" in rendering_data:
+        webdriver = rendering_data["webdriver"]
+        if "window_size" in webdriver:
+            rendering_config["viewport_width"] = webdriver["window_size"].get(
+                "width", 1920
+            )
+            rendering_config["viewport_height"] = webdriver["window_size"].get(
+                "height", 1080
+            )
+        rendering_config["headless"] = webdriver.get("headless", True)
+        rendering_config["timeout"] = webdriver.get("page_load_timeout", 30)
+    if "wait_time_seconds" in rendering_data:
+        rendering_config["wait_time"] = rendering_data["wait_time_seconds"]
+    if "screenshot" in rendering_data:
+        screenshot = rendering_data["screenshot"]
+        rendering_config["screenshot_format"] = screenshot.get(
+            "format", "PNG"
+        ).upper()
+
+    # Use the extracted config or fall back to direct mapping
+    if rendering_config:
+        return RenderingConfig(**rendering_config)
+    # Direct mapping for simple configs
+    return RenderingConfig(
+        **{k: rendering_data[k] for k in rendering_data.keys() & _RENDERING_FIELDS}
+    )
+
+
+def _handle_evaluation(evaluation_data: Any) -> EvaluationConfig:
+    """Build the evaluation config from its known keys."""
+    if not isinstance(evaluation_data, dict):
+        return EvaluationConfig(**evaluation_data)
+    # Extract only the fields that EvaluationConfig expects
+    evaluation_config = {
+        k: evaluation_data[k] for k in evaluation_data.keys() & _EVALUATION_FIELDS
+    }
+    if "criteria" not in evaluation_config and "criteria_weights" in evaluation_data:
+        # Extract criteria names from criteria_weights
+        evaluation_config["criteria"] = list(
+            evaluation_data["criteria_weights"].keys()
+        )
+    if (
+        "scoring_scale" not in evaluation_config
+        and "use_structured_output" in evaluation_data
+    ):
+        # Default scoring scale
+        evaluation_config["scoring_scale"] = 10
+
+    # Use extracted config or fall back to defaults
+    return EvaluationConfig(**evaluation_config)
+
+
+def _handle_provider(provider_data: Any) -> ProviderConfig:
+    """Build the provider config, ignoring keys it does not define."""
+    if not isinstance(provider_data, dict):
+        return ProviderConfig(**provider_data)
+    return ProviderConfig(
+        **{k: provider_data[k] for k in provider_data.keys() & _PROVIDER_FIELDS}
+    )
+
+
+def _handle_projects(project_data: Any) -> ProjectConfig:
+    """Build the project config, ignoring keys it does not define."""
+    if not isinstance(project_data, dict):
+        return ProjectConfig(**project_data)
+    return ProjectConfig(
+        **{k: project_data[k] for k in project_data.keys() & _PROJECT_FIELDS}
+    )
+
+
+# Converters for the nested sections of a config mapping, applied in order
+_SECTION_HANDLERS = {
+    "models": _handle_models,
+    "tasks": _handle_tasks,
+    "rendering": _handle_rendering,
+    "evaluation": _handle_evaluation,
+    "provider": _handle_provider,
+    "projects": _handle_projects,
+}
+
+
+@dataclass(slots=True)
 class Config:
     """Main configuration class for the benchmark system."""
 
     # Model settings
-    models: List[ModelConfig] = field(
-        default_factory=lambda: [
-            ModelConfig("gemma3n:e2b"),
-            ModelConfig("gemma3:4b"),
-            ModelConfig("qwen2.5vl:7b"),
-            ModelConfig("granite3.2-vision:2b"),
-            ModelConfig("llama3.2-vision:11b"),
-            ModelConfig("minicpm-v:8b"),
-            ModelConfig("llava-phi3:3.8b"),
-        ]
-    )
+    models: List[ModelConfig] = field(default_factory=lambda: list(_DEFAULT_MODELS))
     # Task settings
     tasks: TasksConfig = field(default_factory=TasksConfig)
     # Pipeline settings
@@ -189,290 +438,84 @@ class Config:
 
     @classmethod
     def from_yaml(cls, yaml_path: str) -> "Config":
-        """Load configuration from YAML file."""
+        """Load configuration from YAML file.
+
+        Parsed configs are memoized per process while the file is unchanged;
+        each call unpickles a fresh copy so callers can still mutate their config.
+        """
         try:
-            with open(yaml_path, "r") as f:
-                data = yaml.safe_load(f)
-            return cls.from_dict(data)
-        except Exception as e:
-            raise ValueError(f"Failed to load config from {yaml_path}: {e}")
+            st = os.stat(yaml_path)
+            pickled_config = _load_cached(
+                os.path.abspath(yaml_path), st.st_mtime_ns, st.st_size
+            )
+        except (
+            OSError,
+            yaml.YAMLError,
+            json.JSONDecodeError,
+            tomllib.TOMLDecodeError,
+        ) as e:
+            raise ValueError(f"Failed to load config from {yaml_path}: {e}") from e
+        return pickle.loads(pickled_config)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget configs memoized by ``from_yaml`` in this process."""
+        _load_cached.cache_clear()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Config":
-        """Create configuration from dictionary."""
-        try:
-            # Handle models
-            if "models" in data:
-                models = []
-                for model_data in data["models"]:
-                    if isinstance(model_data, str):
-                        models.append(ModelConfig(name=model_data))
-                    else:
-                        models.append(ModelConfig(**model_data))
-                data["models"] = models
-            # Handle tasks
-            if "tasks" in data:
-                if isinstance(data["tasks"], dict) and "task_names" in data["tasks"]:
-                    # Task names from configuration
-                    task_names = data["tasks"]["task_names"]
-                    # Import task definitions
-                    from tasks.task_loader import get_task
-
-                    filtered_tasks = []
-                    for task_name in task_names:
-                        # Get task from task loader
-                        task_def = get_task(task_name)
-                        if task_def:
-                            filtered_tasks.append(
-                                TaskConfig(
-                                    name=task_def.name,
-                                    description=task_def.description,
-                                    prompt_template=task_def.prompt,
-                                    project_type=task_def.project_type,
-                                    framework_version=task_def.framework_version,
-                                )
-                            )
-                        else:
-                            # Fall back to default tasks
-                            default_config = cls()
-                            task = next(
-                                (
-                                    t
-                                    for t in default_config.tasks
-                                    if t.name == task_name
-                                ),
-                                None,
-                            )
-                            if task:
-                                filtered_tasks.append(task)
-                    data["tasks"] = filtered_tasks
-                elif isinstance(data["tasks"], list):
-                    # New format with full task configurations
-                    tasks = []
-                    for task_data in data["tasks"]:
-                        if isinstance(task_data, dict):
-                            tasks.append(TaskConfig(**task_data))
-                        else:
-                            # Handle simple string task names
-                            default_config = cls()
-                            task = next(
-                                (
-                                    t
-                                    for t in default_config.tasks
-                                    if t.name == task_data
-                                ),
-                                None,
-                            )
-                            if task:
-                                tasks.append(task)
-                    data["tasks"] = tasks
-            # Handle rendering config
-            if "rendering" in data:
-                rendering_data = data["rendering"]
-                if isinstance(rendering_data, dict):
-                    # Extract only the fields that RenderingConfig expects
-                    rendering_config = {}
-                    if "webdriver" in rendering_data:
-                        webdriver = rendering_data["webdriver"]
-                        if "window_size" in webdriver:
-                            rendering_config["viewport_width"] = webdriver[
-                                "window_size"
-                            ].get("width", 1920)
-                            rendering_config["viewport_height"] = webdriver[
-                                "window_size"
-                            ].get("height", 1080)
-                        rendering_config["headless"] = webdriver.get("headless", True)
-                        rendering_config["timeout"] = webdriver.get(
-                            "page_load_timeout", 30
-                        )
-                    if "wait_time_seconds" in rendering_data:
-                        rendering_config["wait_time"] = rendering_data[
-                            "wait_time_seconds"
-                        ]
-                    if "screenshot" in rendering_data:
-                        screenshot = rendering_data["screenshot"]
-                        rendering_config["screenshot_format"] = screenshot.get(
-                            "format", "PNG"
-                        ).upper()
-
-                    # Use the extracted config or fall back to direct mapping
-                    if rendering_config:
-                        data["rendering"] = RenderingConfig(**rendering_config)
-                    else:
-                        # Direct mapping for simple configs
-                        data["rendering"] = RenderingConfig(**rendering_data)
-                else:
-                    data["rendering"] = RenderingConfig(**rendering_data)
-            # Handle evaluation config
-            if "evaluation" in data:
-                evaluation_data = data["evaluation"]
-                if isinstance(evaluation_data, dict):
-                    # Extract only the fields that EvaluationConfig expects
-                    evaluation_config = {}
-                    if "judge_models" in evaluation_data:
-                        evaluation_config["judge_models"] = evaluation_data[
-                            "judge_models"
-                        ]
-                    if "criteria" in evaluation_data:
-                        evaluation_config["criteria"] = evaluation_data["criteria"]
-                    elif "criteria_weights" in evaluation_data:
-                        # Extract criteria names from criteria_weights
-                        evaluation_config["criteria"] = list(
-                            evaluation_data["criteria_weights"].keys()
-                        )
-                    if "scoring_scale" in evaluation_data:
-                        evaluation_config["scoring_scale"] = evaluation_data[
-                            "scoring_scale"
-                        ]
-                    elif "use_structured_output" in evaluation_data:
-                        # Default scoring scale
-                        evaluation_config["scoring_scale"] = 10
-                    if "temperature" in evaluation_data:
-                        evaluation_config["temperature"] = evaluation_data[
-                            "temperature"
-                        ]
-
-                    # Use extracted config or fall back to defaults
-                    if evaluation_config:
-                        data["evaluation"] = EvaluationConfig(**evaluation_config)
-                    else:
-                        data["evaluation"] = EvaluationConfig()
-                else:
-                    data["evaluation"] = EvaluationConfig(**evaluation_data)
-            # Handle provider config
-            if "provider" in data:
-                provider_data = data["provider"]
-                if isinstance(provider_data, dict):
-                    # Extract only the fields that ProviderConfig expects
-                    provider_config = {}
-                    expected_fields = {
-                        "provider_type",
-                        "ollama_host",
-                        "vllm_url",
-                        "vllm_model",
-                        "openrouter_url",
-                        "openrouter_model",
-                        "openrouter_api_key",
-                        "openrouter_requests_per_minute",
-                        "gemini_api_key",
-                        "timeout",
-                    }
-                    for key, value in provider_data.items():
-                        if key in expected_fields:
-                            provider_config[key] = value
-
-                    data["provider"] = ProviderConfig(**provider_config)
-                else:
-                    data["provider"] = ProviderConfig(**provider_data)
-
-            # Handle project config
-            if "projects" in data:
-                project_data = data["projects"]
-                if isinstance(project_data, dict):
-                    # Extract only the fields that ProjectConfig expects
-                    project_config = {}
-                    expected_fields = {
-                        "work_dir",
-                        "node_version",
-                        "supported_frameworks",
-                        "default_ports",
-                        "install_timeout",
-                        "build_timeout",
-                        "server_start_timeout",
-                        "cleanup_on_exit",
-                    }
-                    for key, value in project_data.items():
-                        if key in expected_fields:
-                            project_config[key] = value
-
-                    data["projects"] = ProjectConfig(**project_config)
-                else:
-                    data["projects"] = ProjectConfig(**project_data)
-
-            # Filter out unknown fields that don't belong to the Config class
-            config_fields = {
-                "models",
-                "tasks",
-                "iterations",
-                "judges",
-                "mode",
-                "resume_from",
-                "output_dir",
-                "save_intermediate",
-                "compress_logs",
-                "rendering",
-                "projects",
-                "evaluation",
-                "provider",
-                "max_concurrent_models",
-                "memory_threshold",
-                "log_level",
-            }
-            filtered_data = {k: v for k, v in data.items() if k in config_fields}
+        """Create configuration from dictionary.
+
+        Invalid section values surface as the dataclass constructors' own
+        ``TypeError`` rather than being re-wrapped.
+        """
+        # Nothing to convert: an existing config or an empty/blank document
+        if isinstance(data, cls):
+            return data
+        if not data:
+            return cls()
 
-            return cls(**filtered_data)
-        except Exception as e:
-            raise ValueError(f"Failed to create config from dict: {e}")
+        # Convert each nested section present in the data
+        for key, handler in _SECTION_HANDLERS.items():
+            if key in data:
+                data[key] = handler(data[key])
 
-    def to_yaml(self, yaml_path: str):
+        # Filter out unknown fields that don't belong to the Config class
+        filtered_data = {k: data[k] for k in data.keys() & _CONFIG_FIELDS}
+
+        return cls(**filtered_data)
+
+    def to_yaml(self, yaml_path: str) -> None:
         """Save configuration to YAML file."""
+        # Emit the whole document in libyaml first, then write it in one call
+        text = yaml.dump(
+            self.to_dict(), Dumper=_YAML_DUMPER, default_flow_style=False, indent=2
+        )
         try:
-            data = self.to_dict()
             with open(yaml_path, "w") as f:
-                yaml.dump(data, f, default_flow_style=False, indent=2)
-        except Exception as e:
-            raise ValueError(f"Failed to save config to {yaml_path}: {e}")
+                f.write(text)
+        except OSError as e:
+            raise ValueError(f"Failed to save config to {yaml_path}: {e}") from e
+
+    def to_json(self, json_path: str) -> None:
+        """Save configuration to JSON file, bypassing YAML emission."""
+        text = json.dumps(self.to_dict(), indent=2)
+        try:
+            with open(json_path, "w") as f:
+                f.write(text)
+        except OSError as e:
+            raise ValueError(f"Failed to save config to {json_path}: {e}") from e
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
         data = {}
         # Convert models
-        data["models"] = []
-        for model in self.models:
-            data["models"].append(
-                {
-                    "name": model.name,
-                    "temperature": model.temperature,
-                    "num_ctx": model.num_ctx,
-                    "num_predict": model.num_predict,
-                    "timeout": model.timeout,
-                    "max_retries": model.max_retries,
-                }
-            )
+        data["models"] = [asdict(model) for model in self.models]
         # Convert tasks
-        data["tasks"] = []
-        for task in self.tasks:
-            # Handle both TaskConfig and TaskDefinition objects
-            if hasattr(task, "prompt_template"):
-                # This is a TaskConfig object
-                data["tasks"].append(
-                    {
-                        "name": task.name,
-                        "description": task.description,
-                        "prompt_template": task.prompt_template,
-                        "expected_elements": getattr(task, "expected_elements", []),
-                        "difficulty": getattr(task, "difficulty", "medium"),
-                        "project_type": getattr(task, "project_type", "html"),
-                        "framework_version": getattr(task, "framework_version", None),
-                    }
-                )
-            else:
-                # This is a TaskDefinition object
-                data["tasks"].append(
-                    {
-                        "name": task.name,
-                        "description": task.description,
-                        "prompt_template": task.prompt,
-                        "expected_elements": task.expected_features,
-                        "difficulty": (
-                            task.difficulty.value
-                            if hasattr(task.difficulty, "value")
-                            else str(task.difficulty)
-                        ),
-                        "project_type": task.project_type,
-                        "framework_version": task.framework_version,
-                    }
-                )
+        if isinstance(self.tasks, TasksConfig):
+            data["tasks"] = asdict(self.tasks)
+        else:
+            data["tasks"] = [_task_to_dict(task) for task in self.tasks]
         # Add other fields
         data.update(
             {
@@ -488,115 +531,65 @@ class Config:
                 "log_level": self.log_level,
             }
         )
-        # Add rendering config
-        data["rendering"] = {
-            "viewport_width": self.rendering.viewport_width,
-            "viewport_height": self.rendering.viewport_height,
-            "wait_time": self.rendering.wait_time,
-            "screenshot_format": self.rendering.screenshot_format,
-            "headless": self.rendering.headless,
-            "timeout": self.rendering.timeout,
-        }
-        # Add project config
-        data["projects"] = {
-            "work_dir": self.projects.work_dir,
-            "node_version": self.projects.node_version,
-            "supported_frameworks": self.projects.supported_frameworks,
-            "default_ports": self.projects.default_ports,
-            "install_timeout": self.projects.install_timeout,
-            "build_timeout": self.projects.build_timeout,
-            "server_start_timeout": self.projects.server_start_timeout,
-            "cleanup_on_exit": self.projects.cleanup_on_exit,
-        }
-        # Add evaluation config
-        data["evaluation"] = {
-            "judge_models": self.evaluation.judge_models,
-            "criteria": self.evaluation.criteria,
-            "scoring_scale": self.evaluation.scoring_scale,
-            "temperature": self.evaluation.temperature,
-        }
-        # Add provider config
-        data["provider"] = {
-            "provider_type": self.provider.provider_type,
-            "ollama_host": self.provider.ollama_host,
-            "vllm_url": self.provider.vllm_url,
-            "vllm_model": self.provider.vllm_model,
-            "openrouter_url": self.provider.openrouter_url,
-            "openrouter_model": self.provider.openrouter_model,
-            "openrouter_api_key": self.provider.openrouter_api_key,
-            "openrouter_requests_per_minute": self.provider.openrouter_requests_per_minute,
-            "timeout": self.provider.timeout,
-        }
+        data["rendering"] = asdict(self.rendering)
+        data["projects"] = asdict(self.projects)
+        data["evaluation"] = asdict(self.evaluation)
+        # Add provider config (the Gemini key is never written out)
+        data["provider"] = asdict(self.provider)
+        del data["provider"]["gemini_api_key"]
         return data
 
-    def apply_env_overrides(self):
+    def apply_env_overrides(self) -> None:
         """Apply environment variable overrides."""
         # Model settings
-        if os.getenv("BENCHMARK_TEMPERATURE"):
-            temp = float(os.getenv("BENCHMARK_TEMPERATURE"))
-            for model in self.models:
-                model.temperature = temp
-        if os.getenv("BENCHMARK_NUM_CTX"):
-            ctx = int(os.getenv("BENCHMARK_NUM_CTX"))
-            for model in self.models:
-                model.num_ctx = ctx
+        model_overrides = _env_overrides(_MODEL_ENV_OVERRIDES)
+        if model_overrides:
+            self.models = [replace(model, **model_overrides) for model in self.models]
         # Pipeline settings
-        if os.getenv("BENCHMARK_ITERATIONS"):
-            self.iterations = int(os.getenv("BENCHMARK_ITERATIONS"))
-        if os.getenv("BENCHMARK_MODE"):
-            self.mode = os.getenv("BENCHMARK_MODE")
-        if os.getenv("BENCHMARK_OUTPUT_DIR"):
-            self.output_dir = os.getenv("BENCHMARK_OUTPUT_DIR")
-        if os.getenv("BENCHMARK_LOG_LEVEL"):
-            self.log_level = os.getenv("BENCHMARK_LOG_LEVEL")
-
+        for name, value in _env_overrides(_PIPELINE_ENV_OVERRIDES).items():
+            setattr(self, name, value)
         # Provider settings
-        if os.getenv("LLM_PROVIDER"):
-            self.provider.provider_type = os.getenv("LLM_PROVIDER")
-        if os.getenv("OLLAMA_HOST"):
-            self.provider.ollama_host = os.getenv("OLLAMA_HOST")
-        if os.getenv("VLLM_URL"):
-            self.provider.vllm_url = os.getenv("VLLM_URL")
-        if os.getenv("VLLM_MODEL"):
-            self.provider.vllm_model = os.getenv("VLLM_MODEL")
-        if os.getenv("OPENROUTER_URL"):
-            self.provider.openrouter_url = os.getenv("OPENROUTER_URL")
-        if os.getenv("OPENROUTER_MODEL"):
-            self.provider.openrouter_model = os.getenv("OPENROUTER_MODEL")
-        if os.getenv("OPENROUTER_API_KEY"):
-            self.provider.openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
-        if os.getenv("OPENROUTER_REQUESTS_PER_MINUTE"):
-            self.provider.openrouter_requests_per_minute = int(
-                os.getenv("OPENROUTER_REQUESTS_PER_MINUTE")
-            )
+        provider_overrides = _env_overrides(_PROVIDER_ENV_OVERRIDES)
+        if provider_overrides:
+            self.provider = replace(self.provider, **provider_overrides)
 
-    def validate(self):
-        """Validate configuration settings."""
+    def validate(self) -> None:
+        """Validate configuration settings.
+
+        All problems are collected in one pass and reported together in a
+        single ValueError.
+        """
+        errors = []
         # Validate models
         if not self.models:
-            raise ValueError("At least one model must be specified")
+            errors.append("At least one model must be specified")
         for model in self.models:
             if not model.name:
-                raise ValueError("Model name cannot be empty")
+                errors.append("Model name cannot be empty")
             if not 0 <= model.temperature <= 1:
-                raise ValueError(
+                errors.append(
                     f"Model temperature must be between 0 and 1, got {model.temperature}"
                 )
         # Validate tasks
         if not self.tasks:
-            raise ValueError("At least one task must be specified")
+            errors.append("At least one task must be specified")
         for task in self.tasks:
             if not task.name or not task.prompt_template:
-                raise ValueError("Task name and prompt_template are required")
+                errors.append("Task name and prompt_template are required")
         # Validate iterations
         if self.iterations < 1:
-            raise ValueError("Iterations must be at least 1")
+            errors.append("Iterations must be at least 1")
         # Validate mode
-        valid_modes = ["generation-only", "judging-only", "full-pipeline"]
-        if self.mode not in valid_modes:
-            raise ValueError(f"Mode must be one of {valid_modes}")
+        if self.mode not in _VALID_MODES:
+            errors.append(f"Mode must be one of {sorted(_VALID_MODES)}")
         # Validate output directory
         if not self.output_dir:
-            raise ValueError("Output directory cannot be empty")
+            errors.append("Output directory cannot be empty")
+        if errors:
+            raise ValueError("; ".join(dict.fromkeys(errors)))
         # Create output directory if it doesn't exist
         Path(self.output_dir).mkdir(parents=True, exist_ok=True)
+
+
+# Top-level keys accepted by Config.from_dict
+_CONFIG_FIELDS = frozenset(f.name for f in fields(Config))
@@ -5,7 +5,11 @@ import json
 import logging
 import logging.handlers
 import os
+import shutil
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -13,6 +17,17 @@ from typing import Any, Dict, Optional
 from rich.console import Console
 from rich.logging import RichHandler
 
+# Structured fields copied from log records when present
+_EXTRA_FIELDS = (
+    "model_name",
+    "task_name",
+    "iteration",
+    "duration",
+    "memory_usage",
+    "image_attached",
+    "file_attached",
+)
+
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured JSON logging."""
@@ -28,20 +43,10 @@ class StructuredFormatter(logging.Formatter):
             "line": record.lineno,
         }
         # Add extra fields if present
-        if hasattr(record, "model_name"):
-            log_entry["model_name"] = record.model_name
-        if hasattr(record, "task_name"):
-            log_entry["task_name"] = record.task_name
-        if hasattr(record, "iteration"):
-            log_entry["iteration"] = record.iteration
-        if hasattr(record, "duration"):
-            log_entry["duration"] = record.duration
-        if hasattr(record, "memory_usage"):
-            log_entry["memory_usage"] = record.memory_usage
-        if hasattr(record, "image_attached"):
-            log_entry["image_attached"] = record.image_attached
-        if hasattr(record, "file_attached"):
-            log_entry["file_attached"] = record.file_attached
+        record_fields = record.__dict__
+        for name in _EXTRA_FIELDS:
+            if name in record_fields:
+                log_entry[name] = record_fields[name]
         # Add exception info if present
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
@@ -49,19 +54,42 @@ class StructuredFormatter(logging.Formatter):
 
 
 class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
-    """Rotating file handler that compresses old log files."""
+    """Rotating file handler that compresses old log files.
+
+    Compression runs on a single background thread so a rollover never blocks
+    the thread that is emitting log records.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._compressor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="log-compress"
+        )
 
     def doRollover(self):
         """Override to compress the rotated file."""
         super().doRollover()
-        # Compress the rotated file
         rotated_file = f"{self.baseFilename}.1"
         if os.path.exists(rotated_file):
-            compressed_file = f"{rotated_file}.gz"
-            with open(rotated_file, "rb") as f_in:
-                with gzip.open(compressed_file, "wb") as f_out:
-                    f_out.writelines(f_in)
-            os.remove(rotated_file)
+            # Move it aside first so a later rollover cannot rename it mid-copy
+            pending_file = f"{rotated_file}.{time.time_ns()}.pending"
+            os.replace(rotated_file, pending_file)
+            self._compressor.submit(
+                self._compress, pending_file, f"{rotated_file}.gz"
+            )
+
+    @staticmethod
+    def _compress(source: str, target: str):
+        """Gzip ``source`` into ``target`` in 1 MiB chunks, then delete it."""
+        with open(source, "rb") as f_in:
+            with gzip.open(target, "wb", compresslevel=1) as f_out:
+                shutil.copyfileobj(f_in, f_out, 1 << 20)
+        os.remove(source)
+
+    def close(self):
+        """Wait for pending compressions before closing the stream."""
+        self._compressor.shutdown(wait=True)
+        super().close()
 
 
 class Logger:
@@ -88,8 +116,13 @@ class Logger:
         # Setup handlers
         self._setup_console_handler()
         self._setup_file_handlers()
-        # Track API calls and operations
-        self.api_calls = []
+        # Track API calls as running totals and operations
+        self._api_stats_lock = threading.Lock()
+        self.api_call_total = 0
+        self.api_call_total_duration = 0
+        self.api_image_calls = 0
+        self.api_file_calls = 0
+        self.model_stats: Dict[str, Dict[str, Any]] = {}
         self.operations = []
 
     def _setup_console_handler(self):
@@ -134,26 +167,49 @@ class Logger:
         api_log_file = self.log_dir / f"api_calls_{timestamp}.jsonl"
         self.api_log_handler = logging.FileHandler(api_log_file)
         self.api_log_handler.setFormatter(StructuredFormatter())
+        # Dedicated API logger; attached once and kept out of the main logs
+        self.api_logger = logging.getLogger(f"{self.name}.api")
+        self.api_logger.propagate = False
+        self.api_logger.handlers.clear()
+        self.api_logger.addHandler(self.api_log_handler)
+
+    def _log(self, level: int, message: str, args: tuple, kwargs: Dict[str, Any]):
+        """Forward a record to the underlying logger.
+
+        Positional ``args`` are %-formatted lazily by ``logging``; ``exc_info`` and
+        ``stack_info`` are passed through, everything else becomes structured extra.
+        """
+        exc_info = kwargs.pop("exc_info", None)
+        stack_info = kwargs.pop("stack_info", False)
+        self.logger.log(
+            level,
+            message,
+            *args,
+            exc_info=exc_info,
+            stack_info=stack_info,
+            extra=kwargs,
+            stacklevel=3,
+        )
 
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """Log info message with optional structured data."""
-        self.logger.info(message, extra=kwargs)
+        self._log(logging.INFO, message, args, kwargs)
 
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args, **kwargs):
         """Log debug message with optional structured data."""
-        self.logger.debug(message, extra=kwargs)
+        self._log(logging.DEBUG, message, args, kwargs)
 
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning message with optional structured data."""
-        self.logger.warning(message, extra=kwargs)
+        self._log(logging.WARNING, message, args, kwargs)
 
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         """Log error message with optional structured data."""
-        self.logger.error(message, extra=kwargs)
+        self._log(logging.ERROR, message, args, kwargs)
 
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, *args, **kwargs):
         """Log critical message with optional structured data."""
-        self.logger.critical(message, extra=kwargs)
+        self._log(logging.CRITICAL, message, args, kwargs)
 
     def log_model_operation(
         self,
@@ -198,12 +254,19 @@ class Logger:
             "file_attached": file_attached,
             **kwargs,
         }
-        # Store in memory for analysis
-        self.api_calls.append(api_call)
+        # Update running totals for get_api_call_stats
+        with self._api_stats_lock:
+            self.api_call_total += 1
+            self.api_call_total_duration += duration
+            self.api_image_calls += bool(image_attached)
+            self.api_file_calls += bool(file_attached)
+            stats = self.model_stats.setdefault(
+                model_name, {"calls": 0, "total_duration": 0}
+            )
+            stats["calls"] += 1
+            stats["total_duration"] += duration
         # Log to file
-        api_logger = logging.getLogger(f"{self.name}.api")
-        api_logger.addHandler(self.api_log_handler)
-        api_logger.info("API call", extra=api_call)
+        self.api_logger.info("API call", extra=api_call)
         # Log to main logger with summary
         self.info(
             f"API call to {model_name} - Duration: {duration:.2f}s, "
@@ -273,34 +336,25 @@ class Logger:
 
     def get_api_call_stats(self) -> Dict[str, Any]:
         """Get statistics about API calls."""
-        if not self.api_calls:
-            return {}
-        total_calls = len(self.api_calls)
-        total_duration = sum(call["duration"] for call in self.api_calls)
-        avg_duration = total_duration / total_calls
-        model_stats = {}
-        for call in self.api_calls:
-            model = call["model_name"]
-            if model not in model_stats:
-                model_stats[model] = {"calls": 0, "total_duration": 0}
-            model_stats[model]["calls"] += 1
-            model_stats[model]["total_duration"] += call["duration"]
-        for model in model_stats:
-            model_stats[model]["avg_duration"] = (
-                model_stats[model]["total_duration"] / model_stats[model]["calls"]
-            )
-        return {
-            "total_calls": total_calls,
-            "total_duration": total_duration,
-            "average_duration": avg_duration,
-            "model_stats": model_stats,
-            "calls_with_images": sum(
-                1 for call in self.api_calls if call.get("image_attached")
-            ),
-            "calls_with_files": sum(
-                1 for call in self.api_calls if call.get("file_attached")
-            ),
-        }
+        with self._api_stats_lock:
+            if not self.api_call_total:
+                return {}
+            model_stats = {
+                model: {
+                    **stats,
+                    "avg_duration": stats["total_duration"] / stats["calls"],
+                }
+                for model, stats in self.model_stats.items()
+            }
+            return {
+                "total_calls": self.api_call_total,
+                "total_duration": self.api_call_total_duration,
+                "average_duration": self.api_call_total_duration
+                / self.api_call_total,
+                "model_stats": model_stats,
+                "calls_with_images": self.api_image_calls,
+                "calls_with_files": self.api_file_calls,
+            }
 
     def save_summary_report(self, output_path: str):
         """Save a summary report of all logged operations."""
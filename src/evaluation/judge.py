@@ -1,6 +1,7 @@
 """Judge system for evaluating generated HTML using structured output."""
 
 import json
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -16,6 +17,27 @@ from evaluation.evaluation_schemas import (
 )
 
 
+# Fixed text around the HTML in the blind evaluation prompt
+_EVALUATION_PROMPT_PREFIX = """You are an expert frontend developer evaluating HTML code. Evaluate this implementation based on both the code structure and the visual output.
+**HTML Code to Evaluate:**
+```html
+"""
+_EVALUATION_PROMPT_SUFFIX = """
+```
+**Evaluation Criteria:**
+Please evaluate based on the following criteria, providing scores from 0-10 (where 10 is excellent):
+1. **Visual Appeal** (0-10): Assess the overall visual design, aesthetics, color scheme, typography, and visual hierarchy.
+2. **Functionality** (0-10): Evaluate how well the code implements interactive features and apparent functional requirements.
+3. **Responsiveness** (0-10): Assess how well the design adapts to different screen sizes and devices.
+4. **Code Quality** (0-10): Evaluate the HTML structure, CSS organization, JavaScript implementation, and overall code cleanliness.
+5. **Task Completion** (0-10): Based on what you can infer from the code and visual output, assess how complete and functional this implementation appears to be.
+**Additional Analysis:**
+- Identify key strengths and weaknesses
+- Provide specific improvement suggestions
+- Note any technical issues, accessibility concerns, or performance considerations
+- Give an overall assessment and feedback"""
+
+
 class Judge:
     """Evaluates generated HTML using multiple models as judges with structured output."""
 
@@ -24,34 +46,23 @@ class Judge:
         model_manager: ModelManager,
         config: EvaluationConfig,
         output_dir: str = "results",
+        max_concurrent: Optional[int] = None,
     ):
         self.model_manager = model_manager
         self.config = config
         self.output_dir = Path(output_dir)
         self.logger = get_logger()
+        # Bound concurrent judge inferences when called from worker threads; by
+        # default no more than the model manager keeps models loaded
+        self._inference_slots = threading.BoundedSemaphore(
+            max_concurrent or model_manager.max_concurrent_models
+        )
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def _create_evaluation_prompt(self, html_content: str) -> str:
         """Create evaluation prompt for judges (completely blind evaluation)."""
-        prompt = f"""You are an expert frontend developer evaluating HTML code. Evaluate this implementation based on both the code structure and the visual output.
-**HTML Code to Evaluate:**
-```html
-{html_content}
-```
-**Evaluation Criteria:**
-Please evaluate based on the following criteria, providing scores from 0-10 (where 10 is excellent):
-1. **Visual Appeal** (0-10): Assess the overall visual design, aesthetics, color scheme, typography, and visual hierarchy.
-2. **Functionality** (0-10): Evaluate how well the code implements interactive features and apparent functional requirements.
-3. **Responsiveness** (0-10): Assess how well the design adapts to different screen sizes and devices.
-4. **Code Quality** (0-10): Evaluate the HTML structure, CSS organization, JavaScript implementation, and overall code cleanliness.
-5. **Task Completion** (0-10): Based on what you can infer from the code and visual output, assess how complete and functional this implementation appears to be.
-**Additional Analysis:**
-- Identify key strengths and weaknesses
-- Provide specific improvement suggestions
-- Note any technical issues, accessibility concerns, or performance considerations
-- Give an overall assessment and feedback"""
-        return prompt
+        return _EVALUATION_PROMPT_PREFIX + html_content + _EVALUATION_PROMPT_SUFFIX
 
     def evaluate_html(
         self,
@@ -82,13 +93,14 @@ Please evaluate based on the following criteria, providing scores from 0-10 (whe
             prompt = self._create_evaluation_prompt(html_content)
             # Generate structured evaluation
             start_time = time.time()
-            evaluation = self.model_manager.generate_structured(
-                model_name=judge_model,
-                prompt=prompt,
-                response_model=EvaluationResult,
-                image_path=screenshot_path,
-                temperature=self.config.temperature,
-            )
+            with self._inference_slots:
+                evaluation = self.model_manager.generate_structured(
+                    model_name=judge_model,
+                    prompt=prompt,
+                    response_model=EvaluationResult,
+                    image_path=screenshot_path,
+                    temperature=self.config.temperature,
+                )
             duration = time.time() - start_time
             # Ensure metadata is correct
             evaluation.judge_model = judge_model
@@ -167,12 +179,17 @@ Please evaluate based on the following criteria, providing scores from 0-10 (whe
                 self.logger.info(f"Judge {judge_model} evaluating {task_name}")
                 for i, result in enumerate(generation_results):
                     iteration = result["iteration"]
-                    html_content = result["html_content"]
+                    html_content = result.get("html_content")
                     # Use LLM-optimized screenshot for evaluation if available, otherwise use full screenshot
                     screenshot_path = result.get("llm_screenshot_path") or result.get(
                         "screenshot_path"
                     )
                     try:
+                        if html_content is None:
+                            # Loaded on demand when only the path was collected
+                            html_content = Path(result["html_path"]).read_text(
+                                encoding="utf-8"
+                            )
                         evaluation = self.evaluate_html(
                             judge_model=judge_model,
                             target_model=target_model,
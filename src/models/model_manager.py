@@ -1,5 +1,6 @@
 """Model manager for handling multiple models with memory management."""
 
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -63,6 +64,8 @@ class ModelManager:
         self.model_states = {name: ModelState(name=name) for name in self.models.keys()}
         # Currently loaded models
         self.loaded_models = set()
+        # Serialize load/unload so concurrent callers don't race on model state
+        self._state_lock = threading.RLock()
 
         # Check provider availability
         if not self.provider.is_available():
@@ -102,6 +105,11 @@ class ModelManager:
 
     def load_model(self, model_name: str) -> bool:
         """Load a model into memory."""
+        with self._state_lock:
+            return self._load_model(model_name)
+
+    def _load_model(self, model_name: str) -> bool:
+        """Load a model into memory (caller must hold the state lock)."""
         if model_name not in self.models:
             raise ValueError(f"Model {model_name} not configured")
         state = self.model_states[model_name]
@@ -157,6 +165,11 @@ class ModelManager:
 
     def unload_model(self, model_name: str) -> bool:
         """Unload a model from memory."""
+        with self._state_lock:
+            return self._unload_model(model_name)
+
+    def _unload_model(self, model_name: str) -> bool:
+        """Unload a model from memory (caller must hold the state lock)."""
         if model_name not in self.models:
             raise ValueError(f"Model {model_name} not configured")
         state = self.model_states[model_name]
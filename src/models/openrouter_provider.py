@@ -2,6 +2,7 @@
 
 import json
 import os
+import threading
 import time
 from typing import Any, Dict, List, Optional
 
@@ -31,6 +32,8 @@ class OpenRouterProvider(LLMProvider):
         self.logger = get_logger()
         self.conversation_history = {}
         self.last_request_time = 0
+        # Guards last_request_time so concurrent callers are spaced out too
+        self._rate_limit_lock = threading.Lock()
 
         if not self.api_key:
             raise ValueError(
@@ -38,16 +41,23 @@ class OpenRouterProvider(LLMProvider):
             )
 
     def _rate_limit(self):
-        """Apply rate limiting based on requests per minute."""
-        time_since_last = time.time() - self.last_request_time
-        min_interval = 60.0 / self.requests_per_minute
+        """Apply rate limiting based on requests per minute.
 
-        if time_since_last < min_interval:
-            sleep_time = min_interval - time_since_last
-            self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+        The check, sleep and update happen under one lock, so threads sharing
+        this provider are released one interval apart.
+        """
+        with self._rate_limit_lock:
+            time_since_last = time.time() - self.last_request_time
+            min_interval = 60.0 / self.requests_per_minute
 
-        self.last_request_time = time.time()
+            if time_since_last < min_interval:
+                sleep_time = min_interval - time_since_last
+                self.logger.debug(
+                    f"Rate limiting: sleeping for {sleep_time:.2f} seconds"
+                )
+                time.sleep(sleep_time)
+
+            self.last_request_time = time.time()
 
     def is_available(self) -> bool:
         """Check if OpenRouter API is available."""
@@ -2,6 +2,7 @@
 
 import os
 import time
+from dataclasses import replace
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
@@ -355,8 +356,9 @@ class WebRenderer:
                         self.driver.set_window_size(width, height)
                     else:
                         # Temporarily update config
-                        self.config.viewport_width = width
-                        self.config.viewport_height = height
+                        self.config = replace(
+                            self.config, viewport_width=width, viewport_height=height
+                        )
                         self._setup_driver()
                     # Capture screenshot
                     screenshot_path = Path(screenshot_dir) / f"{viewport_name}_view.png"
@@ -374,8 +376,11 @@ class WebRenderer:
             # Restore original viewport size
             if self.driver:
                 self.driver.set_window_size(*original_size)
-            self.config.viewport_width = original_size[0]
-            self.config.viewport_height = original_size[1]
+            self.config = replace(
+                self.config,
+                viewport_width=original_size[0],
+                viewport_height=original_size[1],
+            )
             return results
         except Exception as e:
             self.logger.error(f"Failed to test responsiveness: {e}")
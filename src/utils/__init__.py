@@ -0,0 +1,5 @@
+"""Shared helpers for the benchmark system."""
+
+from .serialization import write_model_json
+
+__all__ = ["write_model_json"]
@@ -0,0 +1,10 @@
+"""JSON serialization helpers."""
+
+from pathlib import Path
+
+from pydantic import BaseModel
+
+
+def write_model_json(model: BaseModel, path: Path) -> None:
+    """Serialize a pydantic model to indented JSON in a single write."""
+    path.write_text(model.model_dump_json(indent=2), encoding="utf-8")